@@ -11,7 +11,8 @@ setup(
   url = 'https://github.com/whdev1/targa',
   download_url = 'https://github.com/whdev1/targa/archive/refs/tags/v1.0.5.tar.gz',
   keywords = ['Targa', 'SQL', 'MySQL', 'async'],
-  install_requires=['aiomysql'],
+  install_requires=['aiomysql', 'PyMySQL'],
+  extras_require={'uvloop': ['uvloop; platform_system != "Windows"']},
   classifiers=[
     'Development Status :: 3 - Alpha',
     'Intended Audience :: Developers',
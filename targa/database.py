@@ -1,29 +1,56 @@
-from .keys import _PK
 from .model import Model
 import aiomysql
-from .errors import InitializationError, MySQLErrors, SubstError
-from typing import Dict, List, Union
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from .errors import InitializationError, SubstError, TransactionError
+from pymysql.converters import escape_string
+import re
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+# the transactions opened with Database.transaction in the current context, mapping each
+# Database instance to the task that opened its transaction and the connection it runs on
+_open_transactions: ContextVar[Dict['Database', Tuple[asyncio.Task, aiomysql.Connection]]] = \
+    ContextVar('_open_transactions', default = None)
+
+# matches either a quoted string literal or identifier (captured) or a bare '?' placeholder
+_PLACEHOLDER_RE: re.Pattern = re.compile(
+    r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`)|\?""", re.DOTALL
+)
+
+# matches the pieces of the contents of a string literal: backslash escapes, runs of other
+# characters and '?' placeholders
+_LITERAL_PIECE_RE: re.Pattern = re.compile(r"\\.|[^\\?]+|\?", re.DOTALL)
 
 class Database:
-    _connection: aiomysql.Connection = None
+    _pool:       aiomysql.Pool                = None
+    _stmt_cache: Dict[Tuple[type, bool], str] = None
+
+    # the number of seconds a pooled connection may sit idle before it is pinged (and
+    # reconnected if necessary) ahead of its next use
+    _ping_threshold: float = 30
+
+    # the number of rows read from the remote database at a time when streaming a query
+    _stream_batch_size: int = 1000
 
     def __init__(
         self,
-        _connection: aiomysql.Connection
+        _pool: aiomysql.Pool
     ) -> None:
         """
         Synchronous initialization method. Accepts an established aiomysql connection
-        and returns a targa.Database wrapping it. Not intended to be called by user code.
+        pool and returns a targa.Database wrapping it. Not intended to be called by user code.
 
         Parameters:
-            _connection: aiomysql.Connection
-                The established aiomysql connection to wrap
+            _pool: aiomysql.Pool
+                The established aiomysql connection pool to wrap
         
         Returns:
             Nothing
         """
         
-        self._connection = _connection
+        self._pool = _pool
+        self._stmt_cache = {}
     
     @staticmethod
     async def connect(
@@ -32,10 +59,14 @@ class Database:
         password: str,
         database_name: str,
         port: int = 3306,
-        autocommit: bool = True
+        autocommit: bool = True,
+        min_connections: int = 1,
+        max_connections: int = 10
     ):
         """
-        Initiates a new async MySQL connection based on the provided credentials.
+        Initiates a new pool of async MySQL connections based on the provided credentials.
+        Each query acquires a connection from the pool, allowing queries issued from
+        concurrent tasks to run in parallel.
 
         Parameters:
             host: str
@@ -55,27 +86,56 @@ class Database:
             
             autocommit: bool = True
                 Represents whether or not this database connection should lock or
-                autocommit queries.
+                autocommit queries. Since each call may run on a different pooled
+                connection, a call made outside of Database.transaction is still
+                committed once it completes when autocommit is disabled.
+            
+            min_connections: int = 1
+                The number of connections the pool should keep open at all times. (1 by default)
+            
+            max_connections: int = 10
+                The maximum number of connections the pool may open at once. (10 by default)
         
         Returns:
-            A new targa.Database instance representing the established connection.
+            A new targa.Database instance representing the established connection pool.
         """
 
-        # initialize an aiomysql connection and wrap a new Targa database instance around it
+        # initialize an aiomysql connection pool and wrap a new Targa database instance around it.
+        # connections are recycled after an hour so that they aren't dropped by the server for
+        # inactivity, and the pool discards any connections that have been closed remotely
         return Database(
-            await aiomysql.connect(
-                host       = host,
-                user       = username,
-                password   = password,
-                db         = database_name,
-                autocommit = autocommit
+            await aiomysql.create_pool(
+                minsize      = min_connections,
+                maxsize      = max_connections,
+                pool_recycle = 3600,
+                host         = host,
+                port         = port,
+                user         = username,
+                password     = password,
+                db           = database_name,
+                autocommit   = autocommit
             )
         )
+    
+    async def close(self) -> None:
+        """
+        Closes all of the connections in the pool and waits for them to be released.
+
+        Parameters:
+            None
+        
+        Returns:
+            Nothing
+        """
+
+        self._ensure_connection()
+
+        self._pool.close()
+        await self._pool.wait_closed()
 
-    async def _ensure_connection(self) -> None:
+    def _ensure_connection(self) -> None:
         """
-        Ensures that a connection to the remote database is both established and
-        active.
+        Ensures that a connection pool to the remote database has been established.
 
         Parameters:
             None
@@ -84,10 +144,114 @@ class Database:
             Nothing
         """
 
-        if not self._connection:
+        if not self._pool:
             raise InitializationError("Database connection was never initialized")
-        else:
-            await self._connection.ping()
+    
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """
+        Acquires a connection from the pool, releasing it back to the pool on exit. The
+        connection is only pinged if it has been idle for longer than the ping threshold,
+        rather than on every use. If the current task has a transaction open, its
+        connection is used instead.
+
+        Parameters:
+            None
+        
+        Returns:
+            An async context manager yielding the acquired aiomysql.Connection.
+        """
+
+        # reuse the connection of an open transaction as is
+        txn_conn: aiomysql.Connection = self._get_txn_conn()
+        if txn_conn is not None:
+            yield txn_conn
+            return
+
+        async with self._pool.acquire() as conn:
+            if asyncio.get_running_loop().time() - conn.last_usage > self._ping_threshold:
+                await conn.ping()
+            
+            yield conn
+    
+    def _get_txn_conn(self) -> Union[aiomysql.Connection, None]:
+        """
+        Gets the connection of the transaction opened with Database.transaction by the
+        current task. Tasks started within the transaction inherit its context but not its
+        connection, since a connection can't be used by more than one task at a time.
+
+        Parameters:
+            None
+        
+        Returns:
+            The aiomysql.Connection of the open transaction, or None if the current task
+            doesn't have one open.
+        """
+
+        txns: Dict['Database', Tuple[asyncio.Task, aiomysql.Connection]] = _open_transactions.get()
+        if txns is not None and self in txns:
+            task, conn = txns[self]
+            if task is asyncio.current_task():
+                return conn
+        
+        return None
+    
+    async def _commit(self, conn: aiomysql.Connection) -> None:
+        """
+        Commits the current transaction on the specified connection unless it belongs to
+        a transaction opened with Database.transaction, which commits once on exit instead.
+
+        Parameters:
+            conn: aiomysql.Connection
+                The connection to commit on.
+        
+        Returns:
+            Nothing
+        """
+
+        if self._get_txn_conn() is None:
+            await conn.commit()
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Opens a transaction spanning all of the queries issued within the async with block
+        by the current task. Queries issued by other tasks, including any started within
+        the block, run on their own connections outside of the transaction. Rather than
+        committing each insert and update individually, the transaction is committed once
+        when the block exits, or rolled back if an exception is raised. Opening a
+        transaction within another joins the outer one.
+
+        Parameters:
+            None
+        
+        Returns:
+            An async context manager representing the open transaction.
+        """
+
+        # ensure that a connection is established
+        self._ensure_connection()
+
+        # join an already open transaction
+        if self._get_txn_conn() is not None:
+            yield
+            return
+
+        async with self._acquire() as conn:
+            await conn.begin()
+
+            token = _open_transactions.set(
+                {**(_open_transactions.get() or {}), self: (asyncio.current_task(), conn)}
+            )
+            try:
+                yield
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+            finally:
+                _open_transactions.reset(token)
     
     async def escape(self, raw_string: str) -> str:
         """
@@ -101,9 +265,12 @@ class Database:
             A str containing the escaped version of the raw string.
         """
 
-        return self._connection.escape_string(str(raw_string))
+        # escaping doesn't require a connection, so none is checked out of the pool. note that
+        # this uses the standard backslash escaping rules and so doesn't account for a server
+        # running with the NO_BACKSLASH_ESCAPES SQL mode
+        return escape_string(str(raw_string))
     
-    async def insert(self, model_inst: Model) -> None:
+    async def insert(self, model_inst: Model) -> Union[int, None]:
         """
         Inserts the specified Targa model instance into the remote database as a new record.
 
@@ -111,37 +278,154 @@ class Database:
             model_inst: Model
                 The Model instance to insert into the remote database.
         
+        Returns:
+            The auto-increment id generated for the new record, or None if the table
+            doesn't generate one.
+        """
+
+        # ensure that a connection is established
+        self._ensure_connection()
+
+        # get the cached INSERT INTO statement for this type of model
+        fields: Tuple[str] = model_inst._fields
+        query: str = self._get_insert_statement(model_inst.__class__)
+
+        # execute the query, letting the driver escape the field values, then commit the result
+        async with self._acquire() as conn, conn.cursor() as cursor:
+            await cursor.execute(query, tuple(getattr(model_inst, field) for field in fields))
+            await self._commit(conn)
+
+            # the id is read from the cursor since each query may run on a different connection,
+            # so it can't be reliably read with a later SELECT LAST_INSERT_ID()
+            return cursor.lastrowid or None
+    
+    async def insert_many(self, model_insts: List[Model]) -> None:
+        """
+        Inserts the specified Targa model instances into the remote database as new records.
+        Rows are sent using multi-row INSERT statements within a single transaction, so
+        either all of them are inserted or, if any statement fails, none of them are. If a
+        transaction is already open, the rows are inserted as part of it.
+
+        Parameters:
+            model_insts: List[Model]
+                The Model instances to insert into the remote database.
+        
         Returns:
             Nothing
         """
 
         # ensure that a connection is established
-        await self._ensure_connection()
+        self._ensure_connection()
 
-        # get the expected table name
-        table_name: str = model_inst._get_table_name()
+        # there is nothing to send if no models were provided
+        if not model_insts:
+            return
 
-        # build up an INSERT INTO query making sure the escape any input data
-        query: str = f"INSERT INTO {table_name} ({', '.join(model_inst.__annotations__.keys())})\n" + \
-                     f"VALUES ("
-        for field in model_inst.__annotations__:
-            if model_inst.__dict__[field] is not None:
-                query += f"'{self._connection.escape_string(str(model_inst.__dict__[field]))}', "
-            else:
-                query += 'NULL, '
-        query = query[:-2] + ')'
+        # the driver may split the rows across several statements, so they're wrapped in a
+        # transaction to commit them all at once
+        async with self.transaction(), self._acquire() as conn, conn.cursor() as cursor:
+            # issue one set of multi-row statements for each type of model provided
+            for model_type, insts in self._group_models(model_insts).items():
+                fields: Tuple[str] = model_type._fields
+                query: str = self._get_insert_statement(model_type)
 
-        # execute the query then commit the result
-        await self.query(query, _ensure_conn = False)
-        await self._connection.commit()
+                await self._execute_many(cursor, query, fields, insts)
+    
+    def _get_insert_statement(self, model_type: type, upsert: bool = False) -> str:
+        """
+        Gets a parameterized INSERT INTO statement for the specified type of model,
+        building and caching it if it hasn't been used before.
+
+        Parameters:
+            model_type: type
+                The Model type to insert instances of.
+            
+            upsert: bool = False
+                Represents whether or not the statement should update existing rows using
+                an ON DUPLICATE KEY UPDATE clause.
+        
+        Returns:
+            A str containing the parameterized statement.
+        """
+
+        key: Tuple[type, bool] = (model_type, upsert)
+        if key not in self._stmt_cache:
+            query: str = model_type._insert_prefix + '(' + ', '.join(['%s'] * len(model_type._fields)) + ')'
+            if upsert:
+                query += "\nON DUPLICATE KEY UPDATE " + \
+                         ', '.join(f"{field} = VALUES({field})" for field in model_type._fields)
+            
+            self._stmt_cache[key] = query
+        
+        return self._stmt_cache[key]
+    
+    def _group_models(self, model_insts: List[Model]) -> Dict[type, List[Model]]:
+        """
+        Groups the specified model instances by their type, preserving the order in
+        which they were provided.
+
+        Parameters:
+            model_insts: List[Model]
+                The Model instances to group.
+        
+        Returns:
+            A dict mapping each Model type to a list of the instances of that type.
+        """
+
+        groups: Dict[type, List[Model]] = {}
+        for model_inst in model_insts:
+            groups.setdefault(model_inst.__class__, []).append(model_inst)
+        
+        return groups
+    
+    async def _execute_many(
+        self,
+        cursor: aiomysql.Cursor,
+        query: str,
+        fields: Tuple[str],
+        model_insts: List[Model]
+    ) -> None:
+        """
+        Executes the specified parameterized statement once for each of the specified model
+        instances. The driver rewrites INSERT statements into multi-row statements, splitting
+        rows across statements as needed to stay under the maximum statement length.
+
+        Parameters:
+            cursor: aiomysql.Cursor
+                The cursor to execute the statement with.
+            
+            query: str
+                The parameterized statement to execute.
+            
+            fields: Tuple[str]
+                The fields of each model instance to bind to the statement parameters.
+            
+            model_insts: List[Model]
+                The Model instances to execute the statement for.
+        
+        Returns:
+            Nothing
+        """
+
+        await cursor.executemany(
+            query,
+            [tuple(getattr(model_inst, field) for field in fields) for model_inst in model_insts]
+        )
     
-    async def query(self, query: str, *substitutions, _ensure_conn: bool = True) -> Union[List[Dict], None]:
+    async def query(
+        self,
+        query: str,
+        *substitutions,
+        stream: bool = False
+    ) -> Union[List[Dict], AsyncIterator[Dict], None]:
         """
         Issues the specified query to the remote database and gets a list of dicts
         representing the rows that were returned. If no rows were received, None is
         returned.
 
-        Performs escaped substitutions for "?" using the provided values.
+        Performs escaped substitutions for "?" using the provided values. The values are
+        bound as query parameters, so string values are quoted automatically. Placeholders
+        within string literals (i.e. '%?%') are also substituted.
 
         Parameters:
             query: str
@@ -149,69 +433,182 @@ class Database:
             
             *substitutions
                 (Optional) A list of values to substitute for "?"
+            
+            stream: bool = False
+                Represents whether or not the returned rows should be streamed from the
+                remote database as they are consumed rather than read into memory at once.
+                Streaming isn't supported within Database.transaction, since the
+                transaction's connection can't issue other queries until all of the
+                streamed rows have been read.
         
         Returns:
             Either a list of dicts representing the returned rows or None if no rows
-            were returned.
+            were returned. If streaming, an async iterator of dicts representing the
+            returned rows is returned instead.
         """
 
         # ensure that a connection is established
-        if _ensure_conn:
-            await self._ensure_connection()
-
-        # perform any substitutions as necessary
-        substitutions = [str(x) for x in substitutions]
-        if len(substitutions) > 0:
-            for n in range(len(substitutions)):
-                # locate a '?' character
-                index: int
-                try:
-                    index = query.index('?')
-                except ValueError:
-                    raise SubstError('Not enough values to substitute for in provided query')
-                
-                # perform a substitution for the '?' ensuring that any input strings are escaped
-                query = query[:index] + self._connection.escape_string(substitutions[n]) + query[index + 1:]
-        
-        column_names: List
-        rows: List
-        async with self._connection.cursor() as cursor:
-            # execute the query and get the response columns and rows from the datrabase. the response
-            # will be provided as a tuple of tuples so it's converted to a list of dicts
-            #
-            # this statement is wrapped in a try so that the database client will ping and reconnect
-            # if the connection has been lost for some reason (i.e. inactivity)
-            runtime_error_occured: bool = False
-            try:
-                await cursor.execute(query)
-            except Exception as outer_ex:
-                await self._connection.ping()
-
-                # sometimes when this point is reached the query will have been executed but
-                # a RuntimeError was thrown. if a duplicate primary key error is raised and a 
-                # RuntimeError already occured previously, this is the case. (this appears to
-                # be brought on by a bug in aiomysql)
-                try:
-                    await cursor.execute(query)
-                except Exception as e:
-                    if isinstance(outer_ex, RuntimeError) and len(e.args) > 0 and e.args[0] == MySQLErrors.duplicate_primary_key:
-                        pass
-                    else:
-                        raise e
+        self._ensure_connection()
+
+        if stream:
+            if self._get_txn_conn() is not None:
+                raise TransactionError('Queries cannot be streamed within a transaction')
+            
+            return self._stream(query, substitutions)
+
+        async with self._acquire() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
+            # execute the query and get the response rows from the database. the cursor builds a
+            # dict for each row as it is read, mapping the column names to the row values
+            await cursor.execute(*self._substitute(query, substitutions))
             
             # check if data was actually returned
+            rows: Union[List[Dict], None] = None
             if cursor.description:
-                column_names = [x[0] for x in list(cursor.description)]
                 rows = list(await cursor.fetchall())
+            
+            # the pool closes any connection released while a transaction is still open, so commit
+            # the query if autocommit is disabled and it isn't part of an open transaction
+            if not conn.get_autocommit():
+                await self._commit(conn)
+            
+            return rows
+
+    async def _stream(self, query: str, substitutions: Tuple) -> AsyncIterator[Dict]:
+        """
+        Issues the specified query to the remote database using a server-side cursor and
+        yields a dict for each returned row as it is received. The connection is held
+        until the iterator is exhausted or closed; wrap it in contextlib.aclosing if the
+        rows may not all be consumed.
+
+        Parameters:
+            query: str
+                The SQL query to send to the remote database.
+            
+            substitutions: Tuple
+                The values to substitute for "?"
+        
+        Returns:
+            An async iterator of dicts representing the returned rows.
+        """
+
+        async with self._acquire() as conn, conn.cursor(aiomysql.SSDictCursor) as cursor:
+            await cursor.execute(*self._substitute(query, substitutions))
+
+            # rows are only yielded if data was actually returned. they're read from the database
+            # in batches so that each row doesn't need to be awaited individually
+            if cursor.description:
+                while True:
+                    rows: List[Dict] = await cursor.fetchmany(self._stream_batch_size)
+                    if not rows:
+                        break
+
+                    for row in rows:
+                        yield row
+            
+            # commit the query if autocommit is disabled and it isn't part of an open transaction.
+            # see Database.query
+            if not conn.get_autocommit():
+                await self._commit(conn)
+
+    def _substitute(self, query: str, substitutions: Tuple) -> Tuple[str, Union[List, None]]:
+        """
+        Converts each "?" placeholder in the specified query into a parameter that the
+        driver binds one of the provided values to. Placeholders within string literals
+        are converted as well, by rewriting the literal as a CONCAT of its text and the
+        bound values (i.e. '%?%' becomes CONCAT('%', ?, '%')). Any remaining "?"
+        characters are left in place.
+
+        Parameters:
+            query: str
+                The SQL query to perform substitutions in.
+            
+            substitutions: Tuple
+                The values to substitute for "?"
+        
+        Returns:
+            A tuple containing the parameterized query and a list of the values to bind to
+            it, or None if no values were provided.
+        """
+
+        # leave the query untouched if there is nothing to substitute
+        if len(substitutions) == 0:
+            return query, None
+
+        # walk over each placeholder and string literal in the query, converting placeholders into
+        # parameters. since the driver formats the query using the '%' operator, any literal '%'
+        # characters must be escaped
+        pieces: List[str] = []
+        args: List = []
+        end: int = 0
+        for match in _PLACEHOLDER_RE.finditer(query):
+            pieces.append(query[end:match.start()].replace('%', '%%'))
+            end = match.end()
+
+            literal: str = match.group(1)
+            if literal is None:
+                # a bare placeholder
+                if len(args) < len(substitutions):
+                    pieces.append('%s')
+                    args.append(substitutions[len(args)])
+                else:
+                    pieces.append('?')
+            elif literal[0] == '`':
+                # placeholders can't be bound within identifiers
+                pieces.append(literal.replace('%', '%%'))
             else:
-                return None
+                pieces.append(self._substitute_literal(literal, substitutions, args))
+        
+        pieces.append(query[end:].replace('%', '%%'))
+
+        if len(args) < len(substitutions):
+            raise SubstError('Not enough values to substitute for in provided query')
+        
+        return ''.join(pieces), args
+    
+    def _substitute_literal(self, literal: str, substitutions: Tuple, args: List) -> str:
+        """
+        Converts any "?" placeholders within the specified quoted string literal into
+        parameters, rewriting the literal as a CONCAT of its text and the parameters if
+        necessary. See Database._substitute.
+
+        Parameters:
+            literal: str
+                The quoted string literal to perform substitutions in.
+            
+            substitutions: Tuple
+                The values to substitute for "?"
+            
+            args: List
+                The values bound so far, which any newly bound values are appended to.
+        
+        Returns:
+            A str containing the SQL to use in place of the literal, with any '%'
+            characters escaped.
+        """
 
-        # zip each of the returned rows into a dict along with the returned column names.
-        return [
-            dict(
-                zip(column_names, row)
-            ) for row in rows
-        ]
+        # split the literal into runs of text and bound parameters
+        quote: str = literal[0]
+        concat_args: List[str] = []
+        text: str = ''
+        for piece in _LITERAL_PIECE_RE.findall(literal[1:-1]):
+            if piece == '?' and len(args) < len(substitutions):
+                if text:
+                    concat_args.append(quote + text.replace('%', '%%') + quote)
+                    text = ''
+                
+                concat_args.append('%s')
+                args.append(substitutions[len(args)])
+            else:
+                text += piece
+        
+        # leave the literal as is if it contained no placeholders
+        if '%s' not in concat_args:
+            return literal.replace('%', '%%')
+        
+        if text:
+            concat_args.append(quote + text.replace('%', '%%') + quote)
+        
+        return concat_args[0] if len(concat_args) == 1 else f"CONCAT({', '.join(concat_args)})"
 
     async def update(self, model_inst: Model, where_clause: str = None) -> None:
         """
@@ -231,38 +628,73 @@ class Database:
         """
 
         # if no WHERE clause was provided, generate one based on a provided primary key annotation
+        pk_field: str = None
         if not where_clause:
-            # derive a list of annotation types
-            annotation_types: List[type] = [type(x[1]) for x in model_inst.__annotations__.items()]
-
-            # get the index of the first primary key annotation
-            pk_field_index: int = annotation_types.index(_PK)
-
             # check that a primary key annotation was actually found
-            pk_field: str
-            if pk_field_index >= 0:
-                pk_field = list(model_inst.__annotations__.keys())[pk_field_index]
-            else:
+            pk_field = model_inst._pk_field
+            if pk_field is None:
                 raise KeyError('A WHERE clause is required if a primary key was not annotated')
 
-            # if it was, generate the WHERE clause
-            where_clause = f"WHERE {pk_field} = '{self._connection.escape_string(str(model_inst.__dict__[pk_field]))}'"
-
         # ensure that a connection is established
-        await self._ensure_connection()
+        self._ensure_connection()
+
+        # build up a parameterized update query, letting the driver escape the field values.
+        # any '%' characters in a provided WHERE clause are escaped so that they aren't
+        # mistaken for parameters
+        fields: Tuple[str] = model_inst._fields
+        args: List = [getattr(model_inst, field) for field in fields]
+        if pk_field:
+            where_clause = f"WHERE {pk_field} = %s"
+            args.append(getattr(model_inst, pk_field))
+        else:
+            where_clause = where_clause.replace('%', '%%')
 
-        # get the table name for this model instance
-        table_name: str = model_inst._get_table_name()
+        query: str = model_inst._update_prefix + where_clause + ';'
 
-        # build up an update query making sure to escape any input
-        query: str = f"UPDATE {table_name}\nSET "
-        for field in model_inst.__annotations__.keys():
-            if model_inst.__dict__[field] is not None:
-                query += f"{field} = '{self._connection.escape_string(str(model_inst.__dict__[field]))}', "
-            else:
-                query += f"{field} = NULL, "
-        query = query[:-2] + '\n' + where_clause + ';'
-    
         # execute the query then commit the result
-        await self.query(query, _ensure_conn = False)
-        await self._connection.commit()
\ No newline at end of file
+        async with self._acquire() as conn, conn.cursor() as cursor:
+            await cursor.execute(query, args)
+            await self._commit(conn)
+    
+    async def update_many(self, model_insts: List[Model]) -> None:
+        """
+        Updates the specified model instances in the remote database based on their
+        annotated primary keys. Rows are sent using multi-row INSERT ... ON DUPLICATE KEY
+        UPDATE statements within a single transaction, so either all of them are updated
+        or, if any statement fails, none of them are. If a transaction is already open, the
+        rows are updated as part of it.
+
+        Note that any model instance whose primary key is not already present in the remote
+        database will be inserted as a new record.
+
+        Parameters:
+            model_insts: List[Model]
+                The model instances that should be updated in the remote database.
+        
+        Returns:
+            Nothing
+        """
+
+        # ensure that a connection is established
+        self._ensure_connection()
+
+        # there is nothing to send if no models were provided
+        if not model_insts:
+            return
+
+        # check that a primary key annotation is present for each type of model, otherwise
+        # rows can't be matched
+        groups: Dict[type, List[Model]] = self._group_models(model_insts)
+        for model_type in groups:
+            if model_type._pk_field is None:
+                raise KeyError('A primary key must be annotated to update multiple models')
+
+        # the driver may split the rows across several statements, so they're wrapped in a
+        # transaction to commit them all at once
+        async with self.transaction(), self._acquire() as conn, conn.cursor() as cursor:
+            # issue one set of multi-row statements for each type of model provided
+            for model_type, insts in groups.items():
+                fields: Tuple[str] = model_type._fields
+                query: str = self._get_insert_statement(model_type, upsert = True)
+
+                await self._execute_many(cursor, query, fields, insts)
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .initializationerror import InitializationError
 from .mysqlerrors import MySQLErrors
-from .substerror import SubstError
\ No newline at end of file
+from .substerror import SubstError
+from .transactionerror import TransactionError
\ No newline at end of file
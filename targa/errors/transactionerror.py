@@ -0,0 +1,2 @@
+class TransactionError(Exception):
+    pass
\ No newline at end of file
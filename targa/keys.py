@@ -4,7 +4,9 @@ class _PK:
     the type specified by the user.
     """
 
-    _type: type = None
+    __slots__ = ('_type',)
+
+    _type: type
 
     def __init__(self, _type: type) -> None:
         """
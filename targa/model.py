@@ -1,7 +1,130 @@
 from typing import Iterable, Optional
 from .keys import _PK
 
-class Model:
+def _compute_table_name(class_name: str) -> str:
+    """
+    Generates and returns the expected SQL table name for a model with the specified
+    class name.
+
+    Parameters:
+        class_name: str
+            The name of the model class.
+    
+    Returns:
+        A string representing the expected remote table name
+    """
+
+    # prepend '_' in front of any capitalized letters that aren't the start of the
+    # class name (i.e. EventTeam becomes Event_Team). str.isupper is used so that
+    # non-ASCII capitals are handled as well
+    table_name: str = ''.join(
+        '_' + char if n > 0 and char.isupper() else char for n, char in enumerate(class_name)
+    )
+
+    # convert the table name to lower case and append an 's' if one isn't
+    # already present (i.e. Event_Team becomes event_teams)
+    table_name = table_name.lower()
+    table_name += 's' if not table_name.endswith('s') else ''
+
+    return table_name
+
+class _ModelMeta(type):
+    """
+    Metaclass for Model. Generates __slots__ from the annotated fields of each derived
+    Model class so that its instances store their fields without a per-instance __dict__.
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, **kwargs) -> type:
+        """
+        Constructs a new Model class, adding __slots__ for its annotated fields.
+
+        Parameters:
+            name: str
+                The name of the class being defined.
+            
+            bases: tuple
+                The base classes of the class being defined.
+            
+            namespace: dict
+                The namespace of the class body.
+            
+            **kwargs
+                Any keyword arguments provided in the class definition.
+        
+        Returns:
+            The new class.
+        """
+
+        # slots can't be generated if the class declares its own or if any of its fields have
+        # a class-level value (which would conflict with the slot), in which case instances
+        # fall back to storing their fields in a __dict__
+        annotations: dict = namespace.get('__annotations__', {})
+        if annotations and '__slots__' not in namespace and not any(field in namespace for field in annotations):
+            namespace['__slots__'] = tuple(annotations)
+
+            # keep instances weak-referenceable unless a base class already provides for it
+            if not any(base.__weakrefoffset__ for base in bases):
+                namespace['__slots__'] += ('__weakref__',)
+        
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+class Model(metaclass = _ModelMeta):
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Caches the fields, table name, primary key, field validators and SQL statement
+        prefixes of each derived Model class as it is defined so that they don't need to
+        be recomputed for each instance or query.
+
+        Parameters:
+            **kwargs
+                Any keyword arguments provided in the class definition.
+        
+        Returns:
+            Nothing
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        # look up the annotations of the nearest class in the MRO that defines any. a class
+        # without annotations of its own (or anywhere in its MRO) doesn't necessarily have
+        # an __annotations__ attribute on older versions of Python
+        annotations: dict = next(
+            (base.__dict__['__annotations__'] for base in cls.__mro__ if '__annotations__' in base.__dict__),
+            {}
+        )
+
+        cls._fields     = tuple(annotations)
+        cls._table_name = _compute_table_name(cls.__name__)
+        cls._pk_field   = next(
+            (field for field, annotation in annotations.items() if isinstance(annotation, _PK)),
+            None
+        )
+
+        # prebuild the column list and the leading portions of the INSERT INTO and UPDATE
+        # statements for this model
+        cls._cols_sql      = ', '.join(cls._fields)
+        cls._insert_prefix = f"INSERT INTO {cls._table_name} ({cls._cols_sql})\nVALUES "
+        cls._update_prefix = f"UPDATE {cls._table_name}\nSET " + \
+                             ', '.join(f"{field} = %s" for field in cls._fields) + '\n'
+
+        # build up a validator for each field consisting of the field name, the type expected
+        # by its annotation and, for an Optional[T] or Union[T, None] annotation, the type T
+        cls._validators = []
+        for field, expected_type in annotations.items():
+            # check for a PK[T] annotation and unwrap one if necessary
+            if isinstance(expected_type, _PK):
+                # extract the type from the PK annotation
+                expected_type = expected_type._type
+            
+            # check for an Optional[T] or Union[T, None] annotation
+            optional_type: type = None
+            if hasattr(expected_type, '__args__') and expected_type.__args__[-1] == type(None):
+                optional_type = expected_type.__args__[0]
+            
+            cls._validators.append((field, expected_type, optional_type))
+
     def __init__(self, **kwargs) -> None:
         """
         Initializes a new instance of this Model using the provided keyword arguments.
@@ -21,46 +144,31 @@ class Model:
                 f"Class {self.__class__.__name__} should not be instantiated directly."
             )
         
-        # loop over all of the fields defined in the derived class
-        for field in self.__annotations__.keys():
-            # get the anticipated type of the field based on its annotation
-            expected_type = self.__annotations__[field]
-
-            # ensure that the field was provided in the constructor and that it doesn't have
-            # a default value already provided
-            if field not in kwargs.keys() and field not in self.__dict__.keys():
+        # loop over the validators of all of the fields defined in the derived class
+        for field, expected_type, optional_type in self._validators:
+            # ensure that the field was provided in the constructor
+            if field not in kwargs:
                 raise AttributeError(
                     f"No value provided for field '{field}' of model {self.__class__.__name__}."
                 )
 
-            # check for a PK[T] annotation and unwrap one if necessary
-            if isinstance(expected_type, _PK):
-                # extract the type from the PK annotation
-                expected_type = expected_type._type
-
             # check if the provided object is of the expected type
-            if kwargs[field].__class__ != expected_type:
-                # check for an Optional[T] or Union[T, None] annotation
-                if hasattr(expected_type, '__args__') and expected_type.__args__[-1] == type(None):
-                    # if this an Optional typing, check if the provided object is None. if not,
-                    # it is invalid
-                    if kwargs[field] and kwargs[field].__class__ != expected_type.__args__[0]:
-                        raise TypeError(
-                            f"Invalid object of type '{kwargs[field].__class__.__name__}' " +
-                            f"provided for field '{field}' of type '{expected_type.__name__}'"
-                        )
-                else:
+            value = kwargs[field]
+            if value.__class__ is not expected_type:
+                # if this an Optional typing, check if the provided object is None. if not,
+                # it is invalid
+                if optional_type is None or (value and value.__class__ is not optional_type):
                     raise TypeError(
-                        f"Invalid object of type '{kwargs[field].__class__.__name__}' " +
+                        f"Invalid object of type '{value.__class__.__name__}' " +
                         f"provided for field '{field}' of type '{expected_type.__name__}'"
                     )
 
             # set the field to have the provided value
-            self.__dict__[field] = kwargs[field]
+            setattr(self, field, value)
     
     def _get_table_name(self) -> str:
         """
-        Generates and returns the expected SQL table name for this model.
+        Returns the expected SQL table name for this model.
 
         Parameters:
             None
@@ -69,25 +177,7 @@ class Model:
             A string representing the expected remote table name
         """
 
-        # start with the class name
-        table_name: str = self.__class__.__name__
-
-        # find any capitalized letters that aren't the start of the class name
-        # and prepend '_' in front of them (i.e. EventTeam becomes Event_Team)
-        n: int = 0
-        while n < len(table_name):
-            if table_name[n].isupper() and n > 0:
-                table_name = table_name[:n] + '_' + table_name[n:]
-                n += 1
-            
-            n += 1
-
-        # convert the table name to lower case and append an 's' if one isn't
-        # already present (i.e. Event_Team becomes event_teams)
-        table_name = table_name.lower()
-        table_name += 's' if not table_name.endswith('s') else ''
-
-        return table_name
+        return self.__class__._table_name
     
     def __iter__(self) -> Iterable:
         """
@@ -100,7 +190,8 @@ class Model:
             Iterable object representing this Model instance.
         """
 
-        yield from self.__dict__.items()
+        for field in self._fields:
+            yield field, getattr(self, field)
     
     def __repr__(self) -> str:
         """
@@ -114,7 +205,7 @@ class Model:
         """
 
         return self.__class__.__name__ + '(' +  ', '.join(
-            [x[0] + '=' + repr(x[1]) for x in self.__dict__.items()]
+            [x[0] + '=' + repr(x[1]) for x in self]
         ) + ')'
     
     def __str__(self) -> str: